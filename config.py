@@ -7,6 +7,8 @@ scale: float
 
 image_directory: str
 svg_directory: str
+# svg_directory followed by a path separator, to build the svg file paths.
+svg_directory_prefix: str
 figma_file_path: str
 gui_path: str
 gui_handler_path: str
@@ -25,17 +27,20 @@ components_config_file_name = 'components_config.py'
 
 generic_components_directory = 'generator/design/components'
 
+_FIGMA_URL_RE = re.compile(r'https://www\.figma\.com/file/([0-9A-Za-z]+)')
+
 
 def set_url(url: str):
     global file_key
-    match = re.search(r'https://www.figma.com/file/([0-9A-Za-z]+)', url.strip())
-    file_key = match.group(1).strip()
+    match = _FIGMA_URL_RE.search(url.strip())
+    file_key = match.group(1)
 
 
 def set_project_directory(directory: str):
     global project_directory, \
         image_directory, \
         svg_directory, \
+        svg_directory_prefix, \
         gui_path, \
         gui_handler_path, \
         figma_file_path, \
@@ -45,6 +50,7 @@ def set_project_directory(directory: str):
     project_directory = directory.strip()
     image_directory = f'{project_directory}/images'
     svg_directory = f'{project_directory}/svg'
+    svg_directory_prefix = f'{svg_directory}/'
     figma_file_path = f'{project_directory}/{figma_file_name}'
     gui_path = f'{project_directory}/gui.py'
     gui_handler_path = f'{project_directory}/{gui_handler_file_name}'
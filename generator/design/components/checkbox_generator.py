@@ -22,13 +22,13 @@ class CheckboxGenerator(ComponentGenerator):
         yield from generate_q_push_button_create(self)
         yield from f"""def __{self.handler_check_changed_function_name}():
     self.{checked_name} = not self.{checked_name}""".splitlines()
-        yield from indent(hide_show_checked_generator.generate_set(f'self.{checked_name}'), n=1)
+        yield from hide_show_checked_generator.generate_set(f'self.{checked_name}', indent_prefix=TAB)
         yield from indent(generate_handler_call(self, self.handler_check_changed_function_name,
                                                 f'self.{checked_name}'), n=1)
         yield from f"""
 def __{self.controller_set_checked_function_name}(checked:bool):
     self.{checked_name} = checked""".splitlines()
-        yield from indent(hide_show_checked_generator.generate_set(f'self.{checked_name}'), n=1)
+        yield from hide_show_checked_generator.generate_set(f'self.{checked_name}', indent_prefix=TAB)
         yield f'self.{self.q_widget_name}.clicked.connect(__{self.handler_check_changed_function_name})'
         yield from generate_controller_setup(self, f'__{self.controller_set_checked_function_name}',
                                              self.controller_set_checked_function_name)
@@ -2,6 +2,43 @@ from generator.design.component_generator import ComponentGenerator
 from generator.properties.visibility_generator import VisibilityGenerator
 from generator.utils import *
 
+# Mouse event handlers and enable / disable functions of the generated button.
+_STATE_HANDLERS = (
+    'def __{w}_mouse_over(*args, **kwargs):',
+    '    if self.{enabled} :',
+    '        __{w}_set_state(True, False, False)',
+    'def __{w}_mouse_leave(*args, **kwargs):',
+    '    if self.{enabled} :',
+    '        __{w}_set_state(False, False, False)',
+    'def __{w}_mouse_press(*args, **kwargs):',
+    '    if self.{enabled} :',
+    '        __{w}_set_state(False, True, False)',
+    'def __{w}_mouse_release(*args, **kwargs):',
+    '    if self.{enabled} :',
+    '        __{w}_set_state(True, False, False)',
+    '        self.{w}.clicked.emit()',
+    'def __{w}_disable(*args, **kwargs):',
+    '    self.{enabled} = False',
+    '    __{w}_set_state(False, False, True)',
+    '    self.{w}.setMouseTracking(False)',
+    '    self.{w}.setFocusPolicy(Qt.NoFocus)',
+    '    self.{w}.setStyleSheet("background-color: rgba(255, 255, 255, 0);")',
+    'def __{w}_enable(*args, **kwargs):',
+    '    self.{enabled} = True',
+    '    __{w}_set_state(False, False, False)',
+    '    self.{w}.setMouseTracking(True)',
+)
+# Connection of the generated functions to the QPushButton events.
+_CONNECT_SIGNALS = (
+    'self.{w}.clicked.connect(__{click})',
+    'self.{w}.enterEvent = __{w}_mouse_over',
+    'self.{w}.leaveEvent = __{w}_mouse_leave',
+    'self.{w}.mousePressEvent = __{w}_mouse_press',
+    'self.{w}.mouseReleaseEvent = __{w}_mouse_release',
+    'self.{w}.disable = __{w}_disable',
+    'self.{w}.enable = __{w}_enable',
+)
+
 
 class CustomButtonGenerator(ComponentGenerator):
     handler_click_function_name: str
@@ -25,56 +62,17 @@ class CustomButtonGenerator(ComponentGenerator):
         enabled_name = f'{self.q_widget_name}_enabled'
         default_enabled = generate_get_component_config(self, 'enabled')
         yield from generate_q_push_button_create(self)
+        fields = {'w': self.q_widget_name, 'enabled': enabled_name, 'click': self.handler_click_function_name}
         yield f'self.{enabled_name} = {default_enabled}'
-        # Mouse over
-        yield from f"""def __{self.q_widget_name}_mouse_over(*args, **kwargs):
-    if self.{enabled_name} :""".splitlines()
-        yield from indent(hide_show_mouse_over_generator.generate_set('True'), n=2)
-        yield from indent(hide_show_pressed_generator.generate_set('False'), n=2)
-        yield from indent(hide_show_disabled_generator.generate_set('False'), n=2)
-
-        # Mouse leave
-        yield from f"""def __{self.q_widget_name}_mouse_leave(*args, **kwargs):
-    if self.{enabled_name} :""".splitlines()
-        yield from indent(hide_show_mouse_over_generator.generate_set('False'), n=2)
-        yield from indent(hide_show_pressed_generator.generate_set('False'), n=2)
-        yield from indent(hide_show_disabled_generator.generate_set('False'), n=2)
-
-        # Mouse press
-        yield from f"""def __{self.q_widget_name}_mouse_press(*args, **kwargs):
-    if self.{enabled_name} :""".splitlines()
-        yield from indent(hide_show_mouse_over_generator.generate_set('False'), n=2)
-        yield from indent(hide_show_pressed_generator.generate_set('True'), n=2)
-        yield from indent(hide_show_disabled_generator.generate_set('False'), n=2)
-
-        # Mouse release
-        yield from f"""def __{self.q_widget_name}_mouse_release(*args, **kwargs):
-    if self.{enabled_name} :""".splitlines()
-        yield from indent(hide_show_mouse_over_generator.generate_set('True'), n=2)
-        yield from indent(hide_show_pressed_generator.generate_set('False'), n=2)
-        yield from indent(hide_show_disabled_generator.generate_set('False'), n=2)
-        yield from indent(f'self.{self.q_widget_name}.clicked.emit()', n=2)
-
-        # Disable
-
-        yield from f"""def __{self.q_widget_name}_disable(*args, **kwargs):
-    self.{enabled_name} = False""".splitlines()
-        yield from indent(hide_show_mouse_over_generator.generate_set('False'))
-        yield from indent(hide_show_pressed_generator.generate_set('False'))
-        yield from indent(hide_show_disabled_generator.generate_set('True'))
-        # disable capture mouse events
-        yield from indent(f'self.{self.q_widget_name}.setMouseTracking(False)')
-        yield from indent(f'self.{self.q_widget_name}.setFocusPolicy(Qt.NoFocus)')
-        yield from indent(f'self.{self.q_widget_name}.setStyleSheet("background-color: rgba(255, 255, 255, 0);")')
+        # Show / hide the mouse over, pressed and disabled children at once
+        yield f'def __{self.q_widget_name}_set_state(mouse_over, pressed, disabled):'
+        yield from hide_show_mouse_over_generator.generate_set('mouse_over', indent_prefix=TAB)
+        yield from hide_show_pressed_generator.generate_set('pressed', indent_prefix=TAB)
+        yield from hide_show_disabled_generator.generate_set('disabled', indent_prefix=TAB)
 
-        # Enable
-        yield from f"""def __{self.q_widget_name}_enable(*args, **kwargs):
-    self.{enabled_name} = True""".splitlines()
-        yield from indent(hide_show_mouse_over_generator.generate_set('False'))
-        yield from indent(hide_show_pressed_generator.generate_set('False'))
-        yield from indent(hide_show_disabled_generator.generate_set('False'))
-        # enable capture mouse events
-        yield from indent(f'self.{self.q_widget_name}.setMouseTracking(True)')
+        # Mouse events, enable and disable
+        for line in _STATE_HANDLERS:
+            yield line.format_map(fields)
 
         # Click handler
         yield f'def __{self.handler_click_function_name}(*args, **kwargs):'
@@ -82,13 +80,8 @@ class CustomButtonGenerator(ComponentGenerator):
         yield from indent(generate_transitions(self))
 
         # Connect signals
-        yield from f"""self.{self.q_widget_name}.clicked.connect(__{self.handler_click_function_name})
-self.{self.q_widget_name}.enterEvent = __{self.q_widget_name}_mouse_over
-self.{self.q_widget_name}.leaveEvent = __{self.q_widget_name}_mouse_leave
-self.{self.q_widget_name}.mousePressEvent = __{self.q_widget_name}_mouse_press
-self.{self.q_widget_name}.mouseReleaseEvent = __{self.q_widget_name}_mouse_release
-self.{self.q_widget_name}.disable = __{self.q_widget_name}_disable
-self.{self.q_widget_name}.enable = __{self.q_widget_name}_enable""".splitlines()
+        for line in _CONNECT_SIGNALS:
+            yield line.format_map(fields)
 
         # Connect controller
         yield from generate_controller_setup(self, f'__{self.controller_enable_function_name}',
@@ -97,9 +90,7 @@ self.{self.q_widget_name}.enable = __{self.q_widget_name}_enable""".splitlines()
                                              self.controller_disable_function_name)
 
         # hide the mouse over, pressed and disabled children
-        yield from hide_show_mouse_over_generator.generate_set('False')
-        yield from hide_show_pressed_generator.generate_set('False')
-        yield from hide_show_disabled_generator.generate_set('False')
+        yield f'__{self.q_widget_name}_set_state(False, False, False)'
 
     def generate_handler(self):
         yield from generate_handler_function(self.handler_click_function_name)
@@ -22,7 +22,7 @@ class ProgressBarGenerator(ComponentGenerator):
             new_bounds = (x, f'({height} * (1 - progress) / 2)', width, height)
 
         yield f'def __{self.controller_set_progress_function_name}(progress:float) :'
-        yield from indent(geometry_generator.generate_set(new_bounds), n=1)
+        yield from geometry_generator.generate_set(new_bounds, indent_prefix=TAB)
         yield from generate_controller_setup(self, f'__{self.controller_set_progress_function_name}',
                                              self.controller_set_progress_function_name)
         yield f'__{self.controller_set_progress_function_name}({progress})'
@@ -33,7 +33,7 @@ self.{self.q_widget_name}.setObjectName("{self.q_widget_name}")
 self.{self.q_widget_name}.setMouseTracking(True)""".splitlines()
         yield from slider_generator.generate_design(orientation=f'{orientation}')
         yield f'def __{self.q_widget_name}_update_content_bounds(value):'
-        yield from indent(content_geometry_generator.generate_set(content_new_bounds))
+        yield from content_geometry_generator.generate_set(content_new_bounds, indent_prefix=TAB)
         axis = 'y' if orientation == 'vertical' else 'x'
         yield from f"""def __{self.q_widget_name}_wheel_event(event):
     value = {slider_generator.value_name}
@@ -50,7 +50,7 @@ def {function_update_thumb_position_name}(*args, **kwargs):
             {self.value_name} = 1""".splitlines()
         yield from indent(generate_handler_call(self, self.handler_value_changed_function_name, f'{self.value_name}'),
                           n=2)
-        yield from indent(thumb_geometry_generator.generate_set(new_thumb_bounds), n=1)
+        yield from thumb_geometry_generator.generate_set(new_thumb_bounds, indent_prefix=TAB)
         yield from f"""
 def __{self.q_widget_name}_mouse_press(*args, **kwargs):
     {captured_name} = True
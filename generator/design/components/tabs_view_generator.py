@@ -27,8 +27,8 @@ class TabsViewGenerator(ComponentGenerator):
 
         yield f'def __select_tab(i):'
         for j, (tab_bar_button, tab_content) in enumerate(tabs):
-            yield from indent(VisibilityGenerator(tab_content).generate_set(f'i == {j}'), n=1)
-            yield from indent(VisibilityGenerator(tab_bar_button).generate_set(f'i == {j}'), n=1)
+            yield from VisibilityGenerator(tab_content).generate_set(f'i == {j}', indent_prefix=TAB)
+            yield from VisibilityGenerator(tab_bar_button).generate_set(f'i == {j}', indent_prefix=TAB)
         yield from indent(generate_handler_call(self, self.handler_tab_changed_function_name, 'i'), n=1)
 
         for i, _ in enumerate(tabs):
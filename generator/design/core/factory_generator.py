@@ -13,6 +13,7 @@ class FactoryGenerator(DesignGenerator):
     """
     Class used to generate different types of components.
     """
+    __slots__ = ()
 
     def generate_design(self):
         """
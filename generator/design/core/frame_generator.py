@@ -9,6 +9,36 @@ from generator.utils import indent, generate_handler_call
 
 from generator.design.design_generator import DesignGenerator
 
+# Header of the generated window class, formatted once per frame.
+# __get_font shares one QFont between the texts of the window with the same family and size.
+_WINDOW_HEADER = (
+    '',
+    '',
+    '',
+    'class {window}(object):',
+    '    is_singleton_open = False',
+    '    def setupUi(self, MainWindow):',
+    '        if not {window}.is_singleton_open:',
+    '            {window}.is_singleton_open = True',
+    '        else:',
+    "            raise Exception('Only one instance of {window} can be opened at a time')",
+    '        if not MainWindow.objectName():',
+    '            MainWindow.setObjectName(u"MainWindow")',
+    '        self.MainWindow = MainWindow',
+    '        MainWindow.resize({width}, {height})',
+    '        self.{w} = QWidget(MainWindow)        ',
+    '        MainWindow.setFixedSize({width}, {height})',
+    '        MainWindow.setWindowTitle("{title}")',
+    '        self.__fonts = {{}}',
+    '        def __get_font(family, size):',
+    '            if (family, size) not in self.__fonts:',
+    '                font = QFont()',
+    '                font.setFamilies([family])',
+    '                font.setPointSize(size)',
+    '                self.__fonts[(family, size)] = font',
+    '            return self.__fonts[(family, size)]',
+)
+
 
 class FrameGenerator(DesignGenerator):
     """
@@ -16,45 +46,49 @@ class FrameGenerator(DesignGenerator):
     """
     short_class_name: str
     window_class_name: str
+    # The generated code of the window, replayed when the window is generated again.
+    # generate_window builds the children and extends the class paths, so it must only run once per generator.
+    design_cache: 'str | None'
 
     windows = {}  # node id -> window name
 
     def __init__(self, figma_node, parent=None):
         super().__init__(figma_node, parent)
         self.window_class_name = f'QWindow{self.short_class_name}'
+        self.design_cache = None
         FrameGenerator.windows[self.figma_node['id']] = self.window_class_name
 
     def generate_design(self) -> Iterator[str]:
         """
         Generates a PyQt6 window (and its children).
+        The generated code is cached, generating the same window again replays it, even if config.scale changed.
+        Build a new generator tree to generate the design at another scale.
+        returns:
+            An iterator yielding the whole code to generate a PyQt6 window as a single multi-line string.
+        """
+        if self.design_cache is None:
+            self.design_cache = '\n'.join(self.generate_window())
+        yield self.design_cache
+
+    def generate_window(self) -> Iterator[str]:
+        """
+        Generates a PyQt6 window (and its children), without caching.
         returns:
             An iterator of strings containing the code to generate a PyQt6 window.
         """
         # import it here to avoid circular import
         from generator.design.core.factory_generator import FactoryGenerator
+        scale = config.scale
         bounds = self.figma_node['absoluteBoundingBox']
         width, height = bounds['width'], bounds['height']
         self.handler_class_path = f'{self.handler_class_path}.{self.short_class_name}Handler'
         self.controller_class_path = f'{self.controller_class_path}.{self.short_class_name}Controller'
         self.strings_class_path = f'{self.strings_class_path}.{self.short_class_name}Strings'
         self.config_class_path = f'{self.config_class_path}.{self.short_class_name}Config'
-        yield from f"""
-
-
-class {self.window_class_name}(object):
-    is_singleton_open = False
-    def setupUi(self, MainWindow):
-        if not {self.window_class_name}.is_singleton_open:
-            {self.window_class_name}.is_singleton_open = True
-        else:
-            raise Exception('Only one instance of {self.window_class_name} can be opened at a time')
-        if not MainWindow.objectName():
-            MainWindow.setObjectName(u"MainWindow")
-        self.MainWindow = MainWindow
-        MainWindow.resize({width * config.scale}, {height * config.scale})
-        self.{self.q_widget_name} = QWidget(MainWindow)        
-        MainWindow.setFixedSize({width * config.scale}, {height * config.scale})
-        MainWindow.setWindowTitle("{self.figma_node['name']}")""".splitlines()
+        fields = {'window': self.window_class_name, 'w': self.q_widget_name, 'title': self.figma_node['name'],
+                  'width': width * scale, 'height': height * scale}
+        for line in _WINDOW_HEADER:
+            yield line.format_map(fields)
         yield from indent(FactoryGenerator(self.figma_node, self).generate_design(), n=2)
         yield from indent(f'MainWindow.setCentralWidget(self.{self.q_widget_name})', n=2)
         yield from indent(generate_handler_call(self, 'window_started'), n=2)
@@ -105,3 +139,8 @@ class {self.handler_class_path.split(".")[-1]}:
     @classmethod
     def get_window_name(cls, node_id):
         return cls.windows.get(node_id, None)
+
+    @classmethod
+    def reset(cls):
+        super().reset()
+        cls.windows.clear()
@@ -13,6 +13,7 @@ class GroupGenerator(DesignGenerator):
     Responsible for generating children of a figma group.
     Also, responsible for increasing the hierarchy level of the Handler, Controller, Strings and Config classes.
     """
+    __slots__ = ()
 
     def generate_design(self):
         """
@@ -36,9 +37,7 @@ class GroupGenerator(DesignGenerator):
 
     def generate_handler(self):
         __doc__ = super().generate_handler().__doc__
-        sub_handlers = []
-        for child in self.children:
-            sub_handlers.extend(child.generate_handler())
+        sub_handlers = list(self.walk_children('generate_handler'))
         if len(sub_handlers) == 0:
             return []
 
@@ -47,9 +46,7 @@ class GroupGenerator(DesignGenerator):
 
     def generate_controller(self):
         __doc__ = super().generate_controller().__doc__
-        sub_controllers = []
-        for child in self.children:
-            sub_controllers.extend(child.generate_controller())
+        sub_controllers = list(self.walk_children('generate_controller'))
         if len(sub_controllers) == 0:
             return []
 
@@ -58,9 +55,7 @@ class GroupGenerator(DesignGenerator):
 
     def generate_strings(self) -> Iterator[Tuple[str, str]]:
         __doc__ = super().generate_strings().__doc__
-        sub_strings = []
-        for child in self.children:
-            sub_strings.extend(child.generate_strings())
+        sub_strings = list(self.walk_children('generate_strings'))
         if len(sub_strings) == 0:
             return []
 
@@ -69,9 +64,7 @@ class GroupGenerator(DesignGenerator):
 
     def generate_config(self) -> Iterator[Tuple[str, str]]:
         __doc__ = super().generate_config().__doc__
-        sub_config = []
-        for child in self.children:
-            sub_config.extend(child.generate_config())
+        sub_config = list(self.walk_children('generate_config'))
         if len(sub_config) == 0:
             return []
 
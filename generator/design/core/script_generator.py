@@ -4,6 +4,7 @@ This module contains the class ScriptGenerator that is responsible for generatin
 import config
 from generator.design.design_generator import DesignGenerator
 from generator.design.core.frame_generator import FrameGenerator
+from generator.design.core.vector_generator import SvgGenerator
 from generator.utils import generate_print
 
 
@@ -12,13 +13,16 @@ class ScriptGenerator(DesignGenerator):
     Responsible for generating the script file, including imports, documentation and the main function.
     """
 
-    handler_class_path = 'GuiHandler'
-    controller_class_path = 'GuiController'
-    config_class_path = 'ComponentsConfig'
-    strings_class_path = 'Strings'
-
     def __init__(self, figma_node, parent=None):
+        # The script generator is the root of the tree, names, windows and svg files of a previous tree don't apply
+        # anymore.
+        FrameGenerator.reset()
+        SvgGenerator.reset()
         super().__init__(figma_node, parent)
+        self.handler_class_path = 'GuiHandler'
+        self.controller_class_path = 'GuiController'
+        self.config_class_path = 'ComponentsConfig'
+        self.strings_class_path = 'Strings'
         figma_frames = self.figma_node['children']
         frames = []
         for frame in figma_frames:
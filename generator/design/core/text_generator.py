@@ -1,12 +1,34 @@
 """
 This module contains the class TextGenerator that is used to generate every text in the design.
 """
+from functools import cached_property
 from typing import Iterator
 
 import config
 from generator.design.design_generator import DesignGenerator
 from generator.utils import generate_controller_setup, generate_print, generate_controller_function
 
+# Translation table used to escape the text content into a python string literal.
+_ESCAPE_TABLE = str.maketrans({'"': '\\"', '\n': '\\n', '\\': '\\\\'})
+# Figma text alignments -> Qt alignment flags.
+_V_ALIGN = {'TOP': 'Qt.AlignTop', 'BOTTOM': 'Qt.AlignBottom', 'CENTER': 'Qt.AlignVCenter'}
+_H_ALIGN = {'LEFT': 'Qt.AlignLeft', 'RIGHT': 'Qt.AlignRight', 'CENTER': 'Qt.AlignHCenter',
+            'JUSTIFIED': 'Qt.AlignJustify'}
+# Code of the generated QLabel, formatted once per text.
+_LABEL_TEMPLATE = (
+    'self.{w} = QLabel(self.{p})',
+    'self.{w}.setText({strings}.{string_name})',
+    'self.{w}.setFont(__get_font(u"{font}", {font_size}))',
+    'self.{w}.setStyleSheet("color: {color}")',
+    'self.{w}.setGeometry({bounds})',
+    'self.{w}.setAlignment({v_align} | {h_align})',
+    'self.{w}.setMouseTracking(False)',
+    'self.{w}.setContextMenuPolicy(Qt.NoContextMenu)',
+    'self.{w}.setWordWrap(True)',
+    'def {set_text}(text:str):',
+    '    self.{w}.setText(text)',
+)
+
 
 class TextGenerator(DesignGenerator):
     """
@@ -15,14 +37,14 @@ class TextGenerator(DesignGenerator):
     # The name of the function used to set the text of the text in the GuiController.
     controller_set_text_function_name: str
 
-    @property
+    @cached_property
     def string(self):
         """
         Get the content of the text.
         returns:
             The content of the text.
         """
-        return self.figma_node['characters'].replace('"', '\\"').replace('\n', '\\n')
+        return self.figma_node['characters'].translate(_ESCAPE_TABLE)
 
     @property
     def string_name(self):
@@ -48,43 +70,15 @@ class TextGenerator(DesignGenerator):
             color = self.figma_node['fills'][0]['color']
             color = f'rgba({color["r"] * 255}, {color["g"] * 255}, {color["b"] * 255}, {color.get("a", 1) * 255})'
 
-        vertical_alignment_figma = self.figma_node['style']['textAlignVertical']
-        horizontal_alignment_figma = self.figma_node['style']['textAlignHorizontal']
-        match vertical_alignment_figma:
-            case 'TOP':
-                vertical_alignment = 'Qt.AlignTop'
-            case 'BOTTOM':
-                vertical_alignment = 'Qt.AlignBottom'
-            case 'CENTER':
-                vertical_alignment = 'Qt.AlignVCenter'
-            case _:
-                vertical_alignment = 'Qt.AlignVCenter'
-        match horizontal_alignment_figma:
-            case 'LEFT':
-                horizontal_alignment = 'Qt.AlignLeft'
-            case 'RIGHT':
-                horizontal_alignment = 'Qt.AlignRight'
-            case 'CENTER':
-                horizontal_alignment = 'Qt.AlignHCenter'
-            case 'JUSTIFIED':
-                horizontal_alignment = 'Qt.AlignJustify'
-            case _:
-                horizontal_alignment = 'Qt.AlignHCenter'
+        vertical_alignment = _V_ALIGN.get(self.figma_node['style']['textAlignVertical'], 'Qt.AlignVCenter')
+        horizontal_alignment = _H_ALIGN.get(self.figma_node['style']['textAlignHorizontal'], 'Qt.AlignHCenter')
 
-        yield from f"""self.{self.q_widget_name} = QLabel(self.{self.parent.q_widget_name})
-self.{self.q_widget_name}.setText({self.strings_class_path}.{self.string_name})
-font = QFont()
-font.setFamilies([u"{font}"])
-font.setPointSize({int(font_size)})
-self.{self.q_widget_name}.setFont(font)
-self.{self.q_widget_name}.setStyleSheet("color: {color}")
-self.{self.q_widget_name}.setGeometry({self.pyqt_bounds})
-self.{self.q_widget_name}.setAlignment({vertical_alignment} | {horizontal_alignment})
-self.{self.q_widget_name}.setMouseTracking(False)
-self.{self.q_widget_name}.setContextMenuPolicy(Qt.NoContextMenu)
-self.{self.q_widget_name}.setWordWrap(True)
-def {self.controller_set_text_function_name}(text:str):
-    self.{self.q_widget_name}.setText(text)""".splitlines()
+        fields = {'w': self.q_widget_name, 'p': self.parent.q_widget_name, 'strings': self.strings_class_path,
+                  'string_name': self.string_name, 'font': font, 'font_size': int(font_size), 'color': color,
+                  'bounds': self.pyqt_bounds, 'v_align': vertical_alignment, 'h_align': horizontal_alignment,
+                  'set_text': self.controller_set_text_function_name}
+        for line in _LABEL_TEMPLATE:
+            yield line.format_map(fields)
         yield from generate_controller_setup(self, self.controller_set_text_function_name,
                                              self.controller_set_text_function_name)
 
@@ -1,44 +1,128 @@
 """
 This module contains the class VectorGenerator that is used to generate every vector in the design. (Images, Shapes, ...)
 """
-from typing import Iterator
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterator, List, Set, Tuple
 
 import config
 from generator.design.design_generator import DesignGenerator
 from generator.utils import logging
 
+# Code of the generated QLabel holding the QSvgWidget, formatted once per vector.
+_SVG_WIDGET_TEMPLATE = (
+    '',
+    'self.{w} = QLabel(self.{p})',
+    'self.{w}.setGeometry({bounds})',
+    'self.{svg_w} = QSvgWidget(self.{w})',
+    'self.{svg_w}.setGeometry(QRect(0, 0, {width}, {height}))',
+    'self.{svg_w}.load("{path}")',
+)
+
+
+@lru_cache(maxsize=4096)
+def _rgb_hex(r: float, g: float, b: float) -> str:
+    """
+    Convert a figma color to its svg hexadecimal representation.
+    Args:
+        r, g, b: The color channels, between 0 and 1.
+    returns:
+        A string of the form '#rrggbb'.
+    """
+    return '#' + bytes((int(r * 255), int(g * 255), int(b * 255))).hex()
+
 
 class SvgGenerator:
     """
     Class used to write svg files from figma geometry.
     """
-    # The counter used to generate unique ids for the svg files.
+    # The counter used to generate unique ids inside a svg file.
     graphic_counter: int = 0
+    # The (path, data) of the svg files waiting to be written by write_svg_files.
+    pending_svg_files: List[Tuple[str, bytes]] = []
+    # The svg file name created for each figma geometry, used to skip the svg generation of identical shapes.
+    svg_files_by_geometry: Dict[str, str] = {}
+    # The names of the svg files already created, named after the hash of their content.
+    svg_files: Set[str] = set()
 
     @classmethod
-    def create_svg_file(cls, figma_node: dict, filename: str):
+    def create_svg_file(cls, figma_node: dict) -> str:
         """
-        Create a svg file from the figma node.
+        Create a svg file from the figma node. The file is only written on the next call to write_svg_files.
+        The file is named after the hash of its content, so identical svg files are only created once.
         Args:
             figma_node: The figma node that contains the fills and the strokes to be written in the svg file.
-            filename: The name of the svg file.
+        returns:
+            The name of the svg file containing the figma node geometry.
         """
+        geometry_key = json.dumps([figma_node.get('fillGeometry', []), figma_node.get('strokeGeometry', []),
+                                   figma_node.get('fills', []), figma_node.get('strokes', []),
+                                   figma_node.get('strokeWeight', 0), figma_node['absoluteBoundingBox']['width'],
+                                   figma_node['absoluteBoundingBox']['height']], sort_keys=True)
+        existing_filename = cls.svg_files_by_geometry.get(geometry_key)
+        if existing_filename is not None:
+            return existing_filename
+
+        cls.graphic_counter = 0
         bounds = f'0 0 {int(figma_node["absoluteBoundingBox"]["width"])} {int(figma_node["absoluteBoundingBox"]["height"])}'
-        svg_file_data = f"""<?xml version="1.0" encoding="UTF-8" standalone="no"?>
-<svg version="1.2" baseProfile="tiny"  xmlns="http://www.w3.org/2000/svg">"""
-        for i, (geometry, fill) in enumerate(
-                zip(figma_node.get('fillGeometry', []), figma_node.get('fills', []))):
-            for line in cls.generate_path(figma_node, geometry['path'], fill):
-                svg_file_data += '\n\t' + line
-
-        for i, (geometry, stroke) in enumerate(
-                zip(figma_node.get('strokeGeometry', []), figma_node.get('strokes', []))):
-            for line in cls.generate_path(figma_node, geometry['path'], stroke):
-                svg_file_data += '\n\t' + line
-
-        svg_file_data += '\n</svg>'
-        with open(f'{config.svg_directory}/{filename}', 'w') as file:
+        parts = ['<?xml version="1.0" encoding="UTF-8" standalone="no"?>\n'
+                 '<svg version="1.2" baseProfile="tiny"  xmlns="http://www.w3.org/2000/svg">']
+        for geometry, fill in zip(figma_node.get('fillGeometry', []), figma_node.get('fills', [])):
+            parts.extend(cls.generate_path(figma_node, geometry['path'], fill))
+
+        for geometry, stroke in zip(figma_node.get('strokeGeometry', []), figma_node.get('strokes', [])):
+            parts.extend(cls.generate_path(figma_node, geometry['path'], stroke))
+
+        svg_file_data = ('\n\t'.join(parts) + '\n</svg>').encode('ascii', 'xmlcharrefreplace')
+        filename = hashlib.blake2b(svg_file_data, digest_size=16).hexdigest() + '.svg'
+        cls.svg_files_by_geometry[geometry_key] = filename
+        if filename not in cls.svg_files:
+            cls.svg_files.add(filename)
+            cls.pending_svg_files.append((config.svg_directory_prefix + filename, svg_file_data))
+        return filename
+
+    @classmethod
+    def write_svg_files(cls):
+        """
+        Write all the pending svg files to disk, overlapping the writes on a thread pool.
+        The svg files are named after their content, so the svg files of the svg directory that don't belong to this
+        generation (shapes edited or removed since the last compilation) are deleted.
+        """
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            # consume the results to raise any error that occurred while writing
+            list(executor.map(cls.write_svg_file, cls.pending_svg_files))
+        for filename in os.listdir(config.svg_directory):
+            if filename.endswith('.svg') and filename not in cls.svg_files:
+                os.remove(config.svg_directory_prefix + filename)
+        cls.pending_svg_files.clear()
+        cls.svg_files_by_geometry.clear()
+        cls.svg_files.clear()
+
+    @classmethod
+    def reset(cls):
+        """
+        Forget the svg files of the previous generator tree, including the ones that were never written.
+        """
+        cls.graphic_counter = 0
+        cls.pending_svg_files.clear()
+        cls.svg_files_by_geometry.clear()
+        cls.svg_files.clear()
+
+    @staticmethod
+    def write_svg_file(svg_file: Tuple[str, bytes]):
+        """
+        Write a single svg file to disk. The file is written to a temporary file first, then moved in place.
+        Args:
+            svg_file: The path of the svg file and its encoded content.
+        """
+        path, svg_file_data = svg_file
+        temp_path = path + '.tmp'
+        with open(temp_path, 'wb') as file:
             file.write(svg_file_data)
+        os.replace(temp_path, path)
 
     @classmethod
     def generate_path(cls, figma_node: dict, path_data: str, graphic: dict) -> Iterator[str]:
@@ -55,61 +139,97 @@ class SvgGenerator:
         stroke_width = figma_node.get('strokeWeight', 0)
         opacity = graphic.get('opacity', 1)
 
-        match graphic['type']:
-            case 'SOLID':
-                color = graphic['color']
-                opacity *= color.get('a', 0)
-                color = color['r'], color['g'], color['b']
-                color = '#{:02x}{:02x}{:02x}'.format(*map(lambda x: int(x * 255), color))
-                yield (f'<path '
-                       f'fill="{color}" stroke-width="{stroke_width}" '
-                       f'fill-opacity="{opacity}" stroke-opacity="{opacity}" '
-                       f'd="{path_data}"/>')
-            case 'IMAGE':
-                image_ref = graphic['imageRef']
-                image = f'../images/{image_ref}.png'
-                width, height = figma_node['absoluteBoundingBox']['width'], figma_node['absoluteBoundingBox'][
-                    'height']
-                img_ref = f'img{cls.graphic_counter}'
-                yield f'<image x="0" y="0" width="{width}" height="{height}" xlink:href="{image}" id="{img_ref}" opacity="{opacity}"/>'
-            case 'GRADIENT_LINEAR':
-                gradient = graphic['gradientHandlePositions']
-                gradient = f'x1="{gradient[0]["x"]}" y1="{gradient[0]["y"]}" x2="{gradient[1]["x"]}" y2="{gradient[1]["y"]}"'
-                stops = graphic['gradientStops']
-                yield f'<linearGradient id="gradient{cls.graphic_counter}" {gradient}>'
-                for stop in stops:
-                    color = stop['color']
-                    stop_opacity = opacity * color.get('a', 1)
-                    color = color['r'], color['g'], color['b']
-                    color = '#{:02x}{:02x}{:02x}'.format(*map(lambda x: int(x * 255), color))
-                    yield f'\t<stop offset="{stop["position"]}" stop-color="{color}" stop-opacity="{stop_opacity}"/>'
-                yield f'</linearGradient>'
-                yield f'<path fill="url(#gradient{cls.graphic_counter})" stroke-width="{stroke_width}" fill-opacity="{opacity}" stroke-opacity="{opacity}" d="{path_data}"/>'
-            case 'GRADIENT_RADIAL':
-                gradient = graphic['gradientHandlePositions']
-                p0, p1 = gradient[0], gradient[-1]
-                radius = ((p0['x'] - p1['x']) ** 2 + (p0['y'] - p1['y']) ** 2) ** .5
-                gradient = f'cx="{p0["x"]}" cy="{p0["y"]}" r="{radius}"'
-                stops = graphic['gradientStops']
-                yield f'<radialGradient id="gradient{cls.graphic_counter}" {gradient}>'
-                for stop in stops:
-                    color = stop['color']
-                    stop_opacity = opacity * color.get('a', 1)
-                    color = color['r'], color['g'], color['b']
-                    color = '#{:02x}{:02x}{:02x}'.format(*map(lambda x: int(x * 255), color))
-                    yield f'\t<stop offset="{stop["position"]}" stop-color="{color}" stop-opacity="{stop_opacity}"/>'
-                yield f'</radialGradient>'
-                yield f'<path fill="url(#gradient{cls.graphic_counter})" stroke-width="{stroke_width}" fill-opacity="{opacity}" stroke-opacity="{opacity}" d="{path_data}"/>'
-            case _:
-                logging.warning(f'Unknown graphic type : {graphic["type"]}')
-                return []
+        generate_graphic = _GRAPHIC_GENERATORS.get(graphic['type'])
+        if generate_graphic is None:
+            logging.warning('Unknown graphic type : %s', graphic['type'])
+            return
+        yield from generate_graphic(figma_node, path_data, graphic, stroke_width, opacity)
+
+    @classmethod
+    def generate_solid(cls, figma_node: dict, path_data: str, graphic: dict, stroke_width: float,
+                       opacity: float) -> Iterator[str]:
+        """
+        Generate the svg path of a solid color graphic. See generate_path.
+        """
+        color = graphic['color']
+        opacity *= color.get('a', 0)
+        color = _rgb_hex(color['r'], color['g'], color['b'])
+        yield (f'<path '
+               f'fill="{color}" stroke-width="{stroke_width}" '
+               f'fill-opacity="{opacity}" stroke-opacity="{opacity}" '
+               f'd="{path_data}"/>')
+
+    @classmethod
+    def generate_image(cls, figma_node: dict, path_data: str, graphic: dict, stroke_width: float,
+                       opacity: float) -> Iterator[str]:
+        """
+        Generate the svg image of an image graphic. See generate_path.
+        """
+        image_ref = graphic['imageRef']
+        image = f'../images/{image_ref}.png'
+        width, height = figma_node['absoluteBoundingBox']['width'], figma_node['absoluteBoundingBox']['height']
+        img_ref = f'img{cls.graphic_counter}'
+        yield f'<image x="0" y="0" width="{width}" height="{height}" xlink:href="{image}" id="{img_ref}" opacity="{opacity}"/>'
+
+    @classmethod
+    def generate_linear_gradient(cls, figma_node: dict, path_data: str, graphic: dict, stroke_width: float,
+                                 opacity: float) -> Iterator[str]:
+        """
+        Generate the svg path of a linear gradient graphic. See generate_path.
+        """
+        gradient = graphic['gradientHandlePositions']
+        gradient = f'x1="{gradient[0]["x"]}" y1="{gradient[0]["y"]}" x2="{gradient[1]["x"]}" y2="{gradient[1]["y"]}"'
+        yield cls.join_gradient('linearGradient', gradient, graphic['gradientStops'], opacity)
+        yield f'<path fill="url(#gradient{cls.graphic_counter})" stroke-width="{stroke_width}" fill-opacity="{opacity}" stroke-opacity="{opacity}" d="{path_data}"/>'
+
+    @classmethod
+    def generate_radial_gradient(cls, figma_node: dict, path_data: str, graphic: dict, stroke_width: float,
+                                 opacity: float) -> Iterator[str]:
+        """
+        Generate the svg path of a radial gradient graphic. See generate_path.
+        """
+        gradient = graphic['gradientHandlePositions']
+        p0, p1 = gradient[0], gradient[-1]
+        radius = ((p0['x'] - p1['x']) ** 2 + (p0['y'] - p1['y']) ** 2) ** .5
+        gradient = f'cx="{p0["x"]}" cy="{p0["y"]}" r="{radius}"'
+        yield cls.join_gradient('radialGradient', gradient, graphic['gradientStops'], opacity)
+        yield f'<path fill="url(#gradient{cls.graphic_counter})" stroke-width="{stroke_width}" fill-opacity="{opacity}" stroke-opacity="{opacity}" d="{path_data}"/>'
+
+    @classmethod
+    def join_gradient(cls, tag: str, attributes: str, stops: List[dict], opacity: float) -> str:
+        """
+        Generate a svg gradient definition and its stops as a single multi-line string.
+        Args:
+            tag: The svg tag of the gradient (linearGradient or radialGradient).
+            attributes: The svg attributes positioning the gradient.
+            stops: The figma gradient stops.
+            opacity: The opacity of the graphic, multiplied with the opacity of each stop.
+        returns:
+            The svg gradient, its lines separated and indented like the other lines of the svg file.
+        """
+        lines = [f'<{tag} id="gradient{cls.graphic_counter}" {attributes}>']
+        for stop in stops:
+            color = stop['color']
+            lines.append(f'\t<stop offset="{stop["position"]}" stop-color="{_rgb_hex(color["r"], color["g"], color["b"])}" '
+                         f'stop-opacity="{opacity * color.get("a", 1)}"/>')
+        lines.append(f'</{tag}>')
+        return '\n\t'.join(lines)
+
+
+# Figma graphic type -> svg generator of the graphic.
+_GRAPHIC_GENERATORS = {
+    'SOLID': SvgGenerator.generate_solid,
+    'IMAGE': SvgGenerator.generate_image,
+    'GRADIENT_LINEAR': SvgGenerator.generate_linear_gradient,
+    'GRADIENT_RADIAL': SvgGenerator.generate_radial_gradient,
+}
 
 
 class VectorGenerator(DesignGenerator):
     """
     Class used to generate every vector in the design. (Images, Shapes, ...)
     """
-    svg_counter: int = 0
+    __slots__ = ()
 
     def generate_design(self):
         """
@@ -117,18 +237,15 @@ class VectorGenerator(DesignGenerator):
         returns:
             An iterator of strings containing the code to generate a QLabel containing a QSvgWidget.
         """
-        VectorGenerator.svg_counter += 1
-
-        svg_filename = f'file{VectorGenerator.svg_counter}.svg'
+        scale = config.scale
+        svg_filename = SvgGenerator.create_svg_file(self.figma_node)
         pyqt_svg_path = f'svg/' + svg_filename
 
-        SvgGenerator.create_svg_file(self.figma_node, svg_filename)
         svg_widget_name = 'q_svg_widget_' + self.q_widget_name
         width, height = self.figma_node['absoluteBoundingBox']['width'], self.figma_node['absoluteBoundingBox'][
             'height']
-        yield from f"""
-self.{self.q_widget_name} = QLabel(self.{self.parent.q_widget_name})
-self.{self.q_widget_name}.setGeometry({self.pyqt_bounds})
-self.{svg_widget_name} = QSvgWidget(self.{self.q_widget_name})
-self.{svg_widget_name}.setGeometry(QRect(0, 0, {int(width * config.scale)}, {int(height * config.scale)}))
-self.{svg_widget_name}.load("{pyqt_svg_path}")""".splitlines()
+        fields = {'w': self.q_widget_name, 'p': self.parent.q_widget_name, 'bounds': self.pyqt_bounds,
+                  'svg_w': svg_widget_name, 'width': int(width * scale), 'height': int(height * scale),
+                  'path': pyqt_svg_path}
+        for line in _SVG_WIDGET_TEMPLATE:
+            yield line.format_map(fields)
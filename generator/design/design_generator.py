@@ -1,39 +1,112 @@
 """
 This module contains the abstract class DesignGenerator that is the base class for all design generators.
 """
+import re
 from abc import abstractmethod
-from typing import List, Iterator
+from functools import lru_cache
+from typing import Dict, Iterator, Sequence, Tuple
 
 import config
 
+# Characters that can't be part of a python identifier (same as not str.isalnum() and not '_').
+_INVALID_RE = re.compile(r'\W+')
+# Runs of underscores, collapsed into a single one.
+_MULTI_US_RE = re.compile(r'_+')
+# Bounding box used for the nodes without one.
+_ZERO_BOX = {'x': 0, 'y': 0, 'width': 0, 'height': 0}
+
+
+@lru_cache(maxsize=4096)
+def _sanitize(name: str) -> str:
+    """
+    Turn a figma node name into a valid python identifier. Figma nodes often share names, so the result is cached.
+    Args:
+        name: The name of the figma node.
+    returns:
+        A valid, lower case, python identifier.
+    """
+    view_name = name.replace(' ', '_').lower()
+    view_name = _INVALID_RE.sub('', view_name)
+    view_name = _MULTI_US_RE.sub('_', view_name).strip('_')
+    if view_name == '':
+        view_name = 'view'
+    if view_name[0].isdigit():
+        view_name = '_' + view_name
+    return view_name
+
+
+@lru_cache(maxsize=4096)
+def _to_camel(name: str) -> str:
+    """
+    Turn a snake case widget name into a camel case class name, e.g. 'main_frame_1' into 'MainFrame1'.
+    It is called with the sanitized figma names, that repeat, not with the unique widget names.
+    Args:
+        name: The snake case name.
+    returns:
+        The camel case name, with the same capitalization rules as str.title().
+    """
+    return name.replace('_', ' ').title().replace(' ', '')
+
+
+class _InheritedPath:
+    """
+    Descriptor for the handler / controller / strings / config class paths.
+    A generator uses the path of its parent until a path is assigned to it, so the paths are not copied to every node.
+    """
+    __slots__ = ('attribute',)
+
+    def __set_name__(self, owner, name):
+        self.attribute = f'_{name}'
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        attribute = self.attribute
+        path = getattr(instance, attribute, None)
+        while path is None:
+            instance = instance.parent
+            if instance is None:
+                return ''
+            path = getattr(instance, attribute, None)
+        return path
+
+    def __set__(self, instance, value):
+        setattr(instance, self.attribute, value)
+
 
 class DesignGenerator:
     """
     Abstract class for all design generators.
     """
 
-    # used_names is a set of all the names that have been used by any design generator to avoid name conflicts.
-    used_names: set = set()
+    # used_names maps every name used by a design generator of the current tree to the next suffix to try
+    # when that name is requested again. The names are shared by all the generated files, so they are unique tree-wide.
+    used_names: Dict[str, int] = {}
+
+    # Design generators are created for every figma node, slots avoid a __dict__ per instance.
+    __slots__ = ('short_class_name', 'parent', 'figma_node', 'children', 'q_widget_name',
+                 '_handler_class_path', '_controller_class_path', '_strings_class_path', '_config_class_path',
+                 '_bounds_cache', '_pyqt_bounds_cache')
 
     # The short class name is the name of the class without the 'Handler' / 'Controller' / ... suffix
     short_class_name: str
     # The parent design generator.
-    parent: 'DesignGenerator|None' = None
+    parent: 'DesignGenerator|None'
     # The figma node that generated this design generator.
     figma_node: dict
-    # The list of children design generators.
-    children: List['DesignGenerator']
+    # The children design generators, a list while the tree is built and a tuple once finalized.
+    children: Sequence['DesignGenerator']
     # The name of the generated q widget.
     q_widget_name: str
 
     # The path to the handler class.
-    handler_class_path: str = ''
+    handler_class_path: str = _InheritedPath()
     # The path to the controller class.
-    controller_class_path: str = ''
+    controller_class_path: str = _InheritedPath()
     # The path to the strings class.
-    strings_class_path: str = ''
+    strings_class_path: str = _InheritedPath()
     # The path to the config class.
-    config_class_path: str = ''
+    config_class_path: str = _InheritedPath()
 
     def __init__(self, figma_node: dict, parent: 'DesignGenerator|None'):
         """
@@ -44,32 +117,33 @@ class DesignGenerator:
         """
         self.figma_node = figma_node
         self.children = []
+        self._bounds_cache = None
+        self._pyqt_bounds_cache = None
         self.q_widget_name = self.create_name(figma_node)
-        self.short_class_name = self.q_widget_name.replace('_', ' ').title().replace(' ', '')
+        # q_widget_name is the sanitized name, possibly followed by '_' and a numeric suffix that title() leaves as is.
+        base_name = _sanitize(figma_node['name'])
+        self.short_class_name = _to_camel(base_name) + self.q_widget_name[len(base_name) + 1:]
+        self.parent = parent
         if parent is not None:
-            self.parent = parent
-            self.parent.children.append(self)
-            self.controller_class_path = parent.controller_class_path
-            self.handler_class_path = parent.handler_class_path
-            self.strings_class_path = parent.strings_class_path
-            self.config_class_path = parent.config_class_path
+            parent.children.append(self)
 
     @property
     def bounds(self) -> (float, float, float, float):
         """
         Get the bounds of the generator relative to the parent.
+        The bounds are computed once, the figma nodes and the scale don't change during the generation.
         returns:
             A tuple of floats (x, y, width, height) representing the bounds of the generator relative to the parent.
         """
-        parent_start_x, parent_start_y = 0, 0
-        if self.parent is not None:
-            parent_bounds = self.parent.figma_node.get('absoluteBoundingBox', {'x': 0, 'y': 0, 'width': 0, 'height': 0})
-            parent_start_x, parent_start_y = parent_bounds['x'], parent_bounds['y']
-        bounds = self.figma_node.get('absoluteBoundingBox', {'x': 0, 'y': 0, 'width': 0, 'height': 0})
-        x, y = bounds['x'] - parent_start_x, bounds['y'] - parent_start_y
-        width, height = bounds['width'], bounds['height']
-        x, y, width, height = x * config.scale, y * config.scale, width * config.scale, height * config.scale
-        return x, y, width, height
+        if self._bounds_cache is not None:
+            return self._bounds_cache
+        scale = config.scale
+        parent_bounds = (self.parent.figma_node.get('absoluteBoundingBox') or _ZERO_BOX) if self.parent is not None \
+            else _ZERO_BOX
+        bounds = self.figma_node.get('absoluteBoundingBox') or _ZERO_BOX
+        self._bounds_cache = ((bounds['x'] - parent_bounds['x']) * scale, (bounds['y'] - parent_bounds['y']) * scale,
+                              bounds['width'] * scale, bounds['height'] * scale)
+        return self._bounds_cache
 
     @property
     def pyqt_bounds(self):
@@ -78,8 +152,10 @@ class DesignGenerator:
         returns:
             A string representing the bounds of the generator relative to the parent in the format of a QRect.
         """
-        x, y, width, height = self.bounds
-        return f'QRect({int(x)}, {int(y)}, {int(width)}, {int(height)})'
+        if self._pyqt_bounds_cache is None:
+            x, y, width, height = self.bounds
+            self._pyqt_bounds_cache = f'QRect({int(x)}, {int(y)}, {int(width)}, {int(height)})'
+        return self._pyqt_bounds_cache
 
     @classmethod
     def create_name(cls, figma_node: dict) -> str:
@@ -90,36 +166,75 @@ class DesignGenerator:
         returns:
             A string representing the name of the given figma node.
         """
-        view_name = figma_node['name'].replace(' ', '_').lower()
-        view_name = ''.join(c for c in view_name if c.isalnum() or c == '_')
-        while '__' in view_name:
-            view_name = view_name.replace('__', '_')
-        while view_name.startswith('_'):
-            view_name = view_name[1:]
-        while view_name.endswith('_'):
-            view_name = view_name[:-1]
-        if view_name == '':
-            view_name = 'view'
-        if view_name[0].isdigit():
-            view_name = '_' + view_name
-        i = 0
-        new_name = view_name
-        while new_name in cls.used_names:
+        used_names = cls.used_names
+        view_name = _sanitize(figma_node['name'])
+        i = used_names.get(view_name)
+        if i is not None:
             new_name = f'{view_name}_{i}'
-            i += 1
-        view_name = new_name
-        cls.used_names.add(view_name)
+            while new_name in used_names:
+                i += 1
+                new_name = f'{view_name}_{i}'
+            used_names[view_name] = i + 1
+            view_name = new_name
+        used_names[view_name] = 0
         return view_name
 
+    @classmethod
+    def reset(cls):
+        """
+        Forget the names used by the previous generator tree. Called before building a new tree.
+        """
+        cls.used_names.clear()
+
     @abstractmethod
     def generate_design(self) -> Iterator[str]:
         """
         Generate the code to create the design of the generator. This code extends 'gui.py'.
         returns:
             An iterator of strings containing the code to reproduce the figma design into a python pyqt6 code.
+            A string may hold several lines when a whole block is generated at once (see FrameGenerator).
         """
         pass
 
+    def render_design(self) -> str:
+        """
+        Generate the whole design code of the generator at once.
+        returns:
+            A string containing the code generated by generate_design.
+        """
+        return '\n'.join(self.generate_design())
+
+    def generate_all(self) -> Tuple[str, str, str, str, str]:
+        """
+        Generate the code of all the generated files in one call, in the only valid order: the design first since it
+        builds the tree, then the svg files it created are written, the tree is finalized and the other files only walk
+        it.
+        returns:
+            A tuple of strings (design, handler, controller, strings, config) containing the code of each file.
+        """
+        # import here to avoid circular import
+        from generator.design.core.vector_generator import SvgGenerator
+        design_code = self.render_design()
+        SvgGenerator.write_svg_files()
+        self.finalize()
+        return (design_code,
+                '\n'.join(self.generate_handler()),
+                '\n'.join(self.generate_controller()),
+                '\n'.join(self.generate_strings()),
+                '\n'.join(self.generate_config()))
+
+    def finalize(self):
+        """
+        Freeze the children of the generator and of all its descendants into tuples.
+        The design generation builds the tree, call it afterwards, before the handler / controller / strings / config
+        generation that only walks the tree.
+        """
+        stack = [self]
+        while stack:
+            generator = stack.pop()
+            generator.children = tuple(generator.children)
+            stack.extend(generator.children)
+
     def generate_handler(self) -> Iterator[str]:
         """
         Generate the code to create the handler of the generator. This code extends 'gui_handler.py'.
@@ -127,8 +242,7 @@ class DesignGenerator:
         returns:
             An iterator of strings containing the code to create the handler of the generator.
         """
-        for child in self.children:
-            yield from child.generate_handler()
+        return self.walk_children('generate_handler') if self.children else iter(())
 
     def generate_controller(self) -> Iterator[str]:
         """
@@ -137,8 +251,7 @@ class DesignGenerator:
         returns:
             An iterator of strings containing the code to create the controller of the generator.
         """
-        for child in self.children:
-            yield from child.generate_controller()
+        return self.walk_children('generate_controller') if self.children else iter(())
 
     def generate_strings(self) -> Iterator[str]:
         """
@@ -147,8 +260,7 @@ class DesignGenerator:
         returns:
             An iterator of strings containing the code to create the strings of the generator.
         """
-        for child in self.children:
-            yield from child.generate_strings()
+        return self.walk_children('generate_strings') if self.children else iter(())
 
     def generate_config(self) -> Iterator[str]:
         """
@@ -157,5 +269,27 @@ class DesignGenerator:
         returns:
             An iterator of strings containing the code to create the config of the generator.
         """
-        for child in self.children:
-            yield from child.generate_config()
+        return self.walk_children('generate_config') if self.children else iter(())
+
+    def walk_children(self, method_name: str) -> Iterator[str]:
+        """
+        Generate the code of the given generate_* method for all the children of the generator.
+        The children that don't override the method only forward it to their own children, so they are walked through
+        with an explicit stack instead of nesting one more generator per tree level.
+        Args:
+            method_name: The name of the generate_* method to call on the children.
+        returns:
+            An iterator of strings containing the code generated by the children.
+        """
+        default_method = getattr(DesignGenerator, method_name)
+        stack = [iter(self.children)]
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+            elif getattr(type(child), method_name) is default_method:
+                # leaves that don't override the method generate nothing, skip them without creating an iterator
+                if child.children:
+                    stack.append(iter(child.children))
+            else:
+                yield from getattr(child, method_name)()
@@ -8,9 +8,9 @@ class GeometryGenerator(PropertyGenerator):
     def generate_get(self) -> str:
         return f'self.{self.target_generator.q_widget_name}.getGeometry()'
 
-    def generate_set(self, value: '(str, str, str, str) | str') -> Iterator[str]:
+    def generate_set(self, value: '(str, str, str, str) | str', indent_prefix: str = '') -> Iterator[str]:
         def generate_set_visible(generator):
-            yield f'self.{generator.q_widget_name}.setGeometry({value})'
+            yield f'{indent_prefix}self.{generator.q_widget_name}.setGeometry({value})'
             for child in generator.children:
                 yield from generate_set_visible(child)
 
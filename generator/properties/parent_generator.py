@@ -8,7 +8,7 @@ class ParentGenerator(PropertyGenerator):
     def generate_get(self) -> str:
         return f'self.{self.target_generator.q_widget_name}.parent()'
 
-    def generate_set(self, value: str) -> Iterator[str]:
-        yield f'self.{self.target_generator.q_widget_name}.setParent({value})'
+    def generate_set(self, value: str, indent_prefix: str = '') -> Iterator[str]:
+        yield f'{indent_prefix}self.{self.target_generator.q_widget_name}.setParent({value})'
         for child in self.target_generator.children:
-            yield from ParentGenerator(child).generate_set(value)
+            yield from ParentGenerator(child).generate_set(value, indent_prefix)
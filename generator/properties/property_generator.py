@@ -15,5 +15,5 @@ class PropertyGenerator:
         pass
 
     @abstractmethod
-    def generate_set(self, value: str) -> Iterator[str]:
+    def generate_set(self, value: str, indent_prefix: str = '') -> Iterator[str]:
         pass
@@ -8,5 +8,5 @@ class VisibilityGenerator(PropertyGenerator):
     def generate_get(self) -> str:
         return f'self.{self.target_generator.q_widget_name}.isVisible()'
 
-    def generate_set(self, value: bool | str) -> Iterator[str]:
-        yield f'self.{self.target_generator.q_widget_name}.setVisible({value})'
+    def generate_set(self, value: bool | str, indent_prefix: str = '') -> Iterator[str]:
+        yield f'{indent_prefix}self.{self.target_generator.q_widget_name}.setVisible({value})'
@@ -11,6 +11,67 @@ import logging
 
 logging.basicConfig(level=logging.DEBUG)
 
+# One level of indentation of the generated code.
+TAB = '    '
+
+# Templates of the generated code, one line per item, formatted with format_map.
+# Code calling a handler function, ignoring a missing handler.
+_HANDLER_CALL = (
+    'try :',
+    '    {function}({value})',
+    'except NameError:',
+    '    {missing}',
+    'except Exception as e:',
+    '    {failed}',
+)
+# Code creating an empty QWidget.
+_Q_WIDGET_CREATE = (
+    'self.{name} = QWidget(self.{parent_name})',
+    'self.{name}.setGeometry({bounds})',
+    'self.{name}.setObjectName("{name}")',
+)
+# Code creating a flat QPushButton, keeping the widget previously created with the same name as a child.
+_Q_PUSH_BUTTON_CREATE = (
+    'try:',
+    '    __temp = self.{name}',
+    'except AttributeError:',
+    '    __temp = None',
+    'self.{name} = QPushButton(self.{parent_name})',
+    'self.{name}.setGeometry({bounds})',
+    'if __temp is not None:',
+    '    __temp.setParent(self.{name})',
+    'self.{name}.setFlat(True)',
+    'self.{name}.setAutoFillBackground(False)',
+    'self.{name}.setObjectName("{name}")',
+    'self.{name}.setMouseTracking(True)',
+    'self.{name}.setContextMenuPolicy(Qt.NoContextMenu)',
+    'self.{name}.setAcceptDrops(False)',
+    'self.{name}.setEnabled({enabled})',
+    'self.{name}.setFocusPolicy(Qt.NoFocus)',
+    'self.{name}.setStyleSheet(f"background-color:" + {background_color})',
+)
+# Code creating a transparent QLineEdit.
+_Q_LINE_EDIT_CREATE = (
+    'try:',
+    '    __temp = self.{name}',
+    'except AttributeError:',
+    '    __temp = None    ',
+    'self.{name} = QLineEdit(self.{parent_name})',
+    'self.{name}.setGeometry({bounds})',
+    'if __temp is not None:',
+    '    self.{name}.setParent(__temp)',
+    'self.{name}.setAutoFillBackground(False)',
+    'self.{name}.setObjectName("{name}")',
+    'self.{name}.setMouseTracking(True)',
+    'self.{name}.setContextMenuPolicy(Qt.NoContextMenu)',
+    'self.{name}.setAcceptDrops(False)',
+    'self.{name}.setFont(QFont("Arial", 20 * {font_size}))',
+    '# set text color, hint color and hint',
+    'self.{name}.setStyleSheet("color: " + {text_color} + "; background-color: rgba(255, 255, 255, 0); '
+    'border: 0px solid rgba(255, 255, 255, 0);")',
+    'self.{name}.setPlaceholderText({hint})',
+)
+
 
 def indent(c: str | Iterator[str], n: int = 1) -> Iterator[str]:
     """
@@ -23,11 +84,11 @@ def indent(c: str | Iterator[str], n: int = 1) -> Iterator[str]:
     """
     if isinstance(c, str):
         for line in c.splitlines():
-            yield '    ' * n + line
+            yield TAB * n + line
         return
 
     for line in c:
-        yield '    ' * n + line
+        yield TAB * n + line
 
 
 def generate_get_component_config(generator: 'DesignGenerator', component_config_key: str) -> str:
@@ -100,13 +161,13 @@ def generate_handler_call(generator: 'DesignGenerator', handler_function_name: s
     returns:
         An iterator of strings containing the code to call the given handler function with the given args.
     """
-    value = ', '.join(args)
-    yield from f"""try :
-    {generator.handler_class_path}.{handler_function_name}({value})
-except NameError:
-    {generate_print(f"'No function {handler_function_name} defined in class {generator.handler_class_path}'")}
-except Exception as e:
-    {generate_print(f"'Caught exception while trying to call {generator.handler_class_path}.{handler_function_name} : ' + str(e)")}""".splitlines()
+    handler_class_path = generator.handler_class_path
+    fields = {'function': f'{handler_class_path}.{handler_function_name}', 'value': ', '.join(args),
+              'missing': generate_print(f"'No function {handler_function_name} defined in class {handler_class_path}'"),
+              'failed': generate_print(f"'Caught exception while trying to call {handler_class_path}."
+                                       f"{handler_function_name} : ' + str(e)")}
+    for line in _HANDLER_CALL:
+        yield line.format_map(fields)
 
 
 def generate_decorate_handler(generator: 'DesignGenerator', handler_function_name: str,
@@ -131,9 +192,10 @@ def generate_q_widget_create(generator: 'DesignGenerator') -> Iterator[str]:
     returns:
         An iterator of strings containing the code to create an empty QWidget for the given generator.
     """
-    yield from f"""self.{generator.q_widget_name} = QWidget(self.{generator.parent.q_widget_name})
-self.{generator.q_widget_name}.setGeometry({generator.pyqt_bounds})
-self.{generator.q_widget_name}.setObjectName("{generator.q_widget_name}")""".splitlines()
+    fields = {'name': generator.q_widget_name, 'parent_name': generator.parent.q_widget_name,
+              'bounds': generator.pyqt_bounds}
+    for line in _Q_WIDGET_CREATE:
+        yield line.format_map(fields)
 
 
 def generate_q_push_button_create(generator: 'ComponentGenerator') -> Iterator[str]:
@@ -149,23 +211,10 @@ def generate_q_push_button_create(generator: 'ComponentGenerator') -> Iterator[s
     generator.component_config['enabled'] = generator.component_config.get('enabled', True)
     background_color = generate_get_component_config(generator, 'pressed_color')
     enabled = generate_get_component_config(generator, 'enabled')
-    yield from f"""try:
-    __temp = self.{generator.q_widget_name}
-except AttributeError:
-    __temp = None
-self.{generator.q_widget_name} = QPushButton(self.{generator.parent.q_widget_name})
-self.{generator.q_widget_name}.setGeometry({generator.pyqt_bounds})
-if __temp is not None:
-    __temp.setParent(self.{generator.q_widget_name})
-self.{generator.q_widget_name}.setFlat(True)
-self.{generator.q_widget_name}.setAutoFillBackground(False)
-self.{generator.q_widget_name}.setObjectName("{generator.q_widget_name}")
-self.{generator.q_widget_name}.setMouseTracking(True)
-self.{generator.q_widget_name}.setContextMenuPolicy(Qt.NoContextMenu)
-self.{generator.q_widget_name}.setAcceptDrops(False)
-self.{generator.q_widget_name}.setEnabled({enabled})
-self.{generator.q_widget_name}.setFocusPolicy(Qt.NoFocus)
-self.{generator.q_widget_name}.setStyleSheet(f"background-color:" + {background_color})""".splitlines()
+    fields = {'name': generator.q_widget_name, 'parent_name': generator.parent.q_widget_name,
+              'bounds': generator.pyqt_bounds, 'enabled': enabled, 'background_color': background_color}
+    for line in _Q_PUSH_BUTTON_CREATE:
+        yield line.format_map(fields)
 
 
 def generate_q_line_edit_create(generator: 'ComponentGenerator') -> Iterator[str]:
@@ -182,23 +231,11 @@ def generate_q_line_edit_create(generator: 'ComponentGenerator') -> Iterator[str
     generator.component_config['hint'] = generator.component_config.get('hint', "''")
     text_color = generate_get_component_config(generator, 'text_color')
     hint = generate_get_component_config(generator, 'hint')
-    yield from f"""try:
-    __temp = self.{generator.q_widget_name}
-except AttributeError:
-    __temp = None    
-self.{generator.q_widget_name} = QLineEdit(self.{generator.parent.q_widget_name})
-self.{generator.q_widget_name}.setGeometry({generator.pyqt_bounds})
-if __temp is not None:
-    self.{generator.q_widget_name}.setParent(__temp)
-self.{generator.q_widget_name}.setAutoFillBackground(False)
-self.{generator.q_widget_name}.setObjectName("{generator.q_widget_name}")
-self.{generator.q_widget_name}.setMouseTracking(True)
-self.{generator.q_widget_name}.setContextMenuPolicy(Qt.NoContextMenu)
-self.{generator.q_widget_name}.setAcceptDrops(False)
-self.{generator.q_widget_name}.setFont(QFont("Arial", 20 * {config.scale * config.text_scale}))
-# set text color, hint color and hint
-self.{generator.q_widget_name}.setStyleSheet("color: " + {text_color} + "; background-color: rgba(255, 255, 255, 0); border: 0px solid rgba(255, 255, 255, 0);")
-self.{generator.q_widget_name}.setPlaceholderText({hint})""".splitlines()
+    fields = {'name': generator.q_widget_name, 'parent_name': generator.parent.q_widget_name,
+              'bounds': generator.pyqt_bounds, 'font_size': config.scale * config.text_scale,
+              'text_color': text_color, 'hint': hint}
+    for line in _Q_LINE_EDIT_CREATE:
+        yield line.format_map(fields)
 
 
 def generate_transitions(generator: 'DesignGenerator') -> Iterator[str]:
@@ -59,11 +59,7 @@ if __name__ == '__main__':
         figma_file = json.load(file)
     figma_node = figma_file['document']['children'][0]
     script_generator = generator.design.core.script_generator.ScriptGenerator(figma_node, None)
-    python_code = '\n'.join(script_generator.generate_design())
-    handler_code = '\n'.join(script_generator.generate_handler())
-    controller_code = '\n'.join(script_generator.generate_controller())
-    strings_code = '\n'.join(script_generator.generate_strings())
-    config_code = '\n'.join(script_generator.generate_config())
+    python_code, handler_code, controller_code, strings_code, config_code = script_generator.generate_all()
     with open(config.gui_path, 'w', encoding="utf-8") as file:
         file.write(python_code)
     with open(config.gui_controller_path, 'w', encoding="utf-8") as file:
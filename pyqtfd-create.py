@@ -28,12 +28,8 @@ if __name__ == '__main__':
         if os.path.exists(config.project_directory):
             shutil.rmtree(config.project_directory)
 
-    if not os.path.exists(config.project_directory):
-        os.makedirs(config.project_directory, exist_ok=True)
-    if not os.path.exists(config.image_directory):
-        os.makedirs(config.image_directory, exist_ok=True)
-    if not os.path.exists(config.svg_directory):
-        os.makedirs(config.svg_directory, exist_ok=True)
+    for directory in (config.project_directory, config.image_directory, config.svg_directory):
+        os.makedirs(directory, exist_ok=True)
 
     config.check_project_directory()
 